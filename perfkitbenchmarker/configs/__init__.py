@@ -266,19 +266,19 @@ def MergeConfigs(default_config, override_config, warn_new_key=False):
     return default_config
 
 
-def LoadMinimalConfig(benchmark_config, benchmark_name):
-  """Loads a benchmark config without using any flags in the process.
+@functools.lru_cache()
+def _LoadSerializedMinimalConfig(benchmark_config, benchmark_name):
+  """Parses a benchmark config and returns it serialized as JSON.
 
-  This function will prepend configs/default_config_constants.yaml to the
-  benchmark config prior to loading it. This allows the config to use
-  references to anchors defined in the constants file.
+  Benchmark modules load their default config every time GetConfig is called,
+  so the YAML parse is cached and callers deserialize a fresh copy.
 
   Args:
     benchmark_config: str. The default config in YAML format.
     benchmark_name: str. The name of the benchmark.
 
   Returns:
-    dict. The loaded config.
+    str. The loaded config serialized as JSON.
   """
   yaml_config = []
   yaml_config.append(_LoadConfigConstants())
@@ -295,13 +295,29 @@ def LoadMinimalConfig(benchmark_config, benchmark_name):
         'Encountered a problem loading the default benchmark config. Please '
         'ensure that all references are defined. Error received:\n%s' % e)
 
-  config = config[benchmark_name]
+  return json.dumps(config[benchmark_name])
+
+
+def LoadMinimalConfig(benchmark_config, benchmark_name):
+  """Loads a benchmark config without using any flags in the process.
+
+  This function will prepend configs/default_config_constants.yaml to the
+  benchmark config prior to loading it. This allows the config to use
+  references to anchors defined in the constants file.
+
+  Args:
+    benchmark_config: str. The default config in YAML format.
+    benchmark_name: str. The name of the benchmark.
+
+  Returns:
+    dict. The loaded config.
+  """
   # yaml safe_parse parses anchor by reference and return the same
   # object when the same anchor is used multiple times.
-  # Seralize and deserialize to make sure all objects in the dictionary are
-  # unique.
-  config = json.loads(json.dumps(config))
-  return config
+  # Deserialize the cached config to make sure all objects in the dictionary
+  # are unique and not shared with other callers.
+  return json.loads(
+      _LoadSerializedMinimalConfig(benchmark_config, benchmark_name))
 
 
 def LoadConfig(benchmark_config, user_config, benchmark_name):
@@ -114,6 +114,17 @@ flags.DEFINE_boolean(
     'cluster_boot_test_port_listening', False,
     'Test the time it takes to successfully connect to the port that is used '
     'to run the remote command.')
+# These control SSH polling in linux_virtual_machine._WaitForSSH, which every
+# benchmark uses to wait for its Linux VMs, not only cluster_boot.
+flags.DEFINE_integer(
+    'cluster_boot_ssh_poll_initial_ms', 100,
+    'Initial interval in milliseconds between attempts to SSH into a booting '
+    'Linux VM. Applies to all benchmarks. The interval doubles after each '
+    'failed attempt, up to --cluster_boot_ssh_poll_max_ms.', lower_bound=1)
+flags.DEFINE_integer(
+    'cluster_boot_ssh_poll_max_ms', 1000,
+    'Maximum interval in milliseconds between attempts to SSH into a booting '
+    'Linux VM. Applies to all benchmarks.', lower_bound=1)
 FLAGS = flags.FLAGS
 
 
@@ -148,93 +159,132 @@ def GetTimeToBoot(vms):
   if not vms:
     return []
 
-  # Time that metrics are measured against.
-  min_create_start_time = min(vm.create_start_time for vm in vms)
+  num_vms = len(vms)
+
+  # Gather each timestamp across the cluster once so that every metric below
+  # is a single pass over a flat list rather than repeated VM attribute reads.
+  create_start_times = [vm.create_start_time for vm in vms]
+  create_return_times = [vm.create_return_time for vm in vms]
+  is_running_times = [vm.is_running_time for vm in vms]
+  bootable_times = [vm.bootable_time for vm in vms]
+  os_types = [vm.OS_TYPE for vm in vms]
+  for create_start_time, bootable_time in zip(create_start_times,
+                                              bootable_times):
+    assert create_start_time
+    assert bootable_time
+    assert bootable_time >= create_start_time
 
-  # Vars used to store max values for whole-cluster boot metrics.
-  max_create_delay_sec = 0
-  max_boot_time_sec = 0
-  max_port_listening_time_sec = 0
-  max_rdp_port_listening_time_sec = 0
+  # Time that metrics are measured against.
+  min_create_start_time = min(create_start_times)
+  create_delays_sec = [
+      create_start_time - min_create_start_time
+      for create_start_time in create_start_times
+  ]
+  max_create_delay_sec = max(create_delays_sec)
+  metadatas = [{
+      'machine_instance': i,
+      'num_vms': num_vms,
+      'os_type': os_type,
+      'create_delay_sec': f'{create_delay_sec:.1f}'
+  } for i, (os_type, create_delay_sec) in enumerate(
+      zip(os_types, create_delays_sec))]
 
   samples = []
-  os_types = set()
-  for i, vm in enumerate(vms):
-    assert vm.create_start_time
-    assert vm.bootable_time
-    assert vm.bootable_time >= vm.create_start_time
-
-    os_types.add(vm.OS_TYPE)
-    create_delay_sec = vm.create_start_time - min_create_start_time
-    max_create_delay_sec = max(max_create_delay_sec, create_delay_sec)
-    metadata = {
-        'machine_instance': i,
-        'num_vms': len(vms),
-        'os_type': vm.OS_TYPE,
-        'create_delay_sec': '%0.1f' % create_delay_sec
-    }
 
-    # TIME TO CREATE ASYNC RETURN
-    if vm.create_return_time:
-      time_to_create_sec = vm.create_return_time - min_create_start_time
-      samples.append(
-          sample.Sample('Time to Create Async Return', time_to_create_sec,
-                        'seconds', metadata))
-
-    # TIME TO RUNNING
-    if vm.is_running_time:
-      time_to_running_sec = vm.is_running_time - vm.create_start_time
-      samples.append(
-          sample.Sample('Time to Running', time_to_running_sec, 'seconds',
-                        metadata))
-
-    # TIME TO SSH
-    boot_time_sec = vm.bootable_time - min_create_start_time
-    if isinstance(vm, linux_virtual_machine.BaseLinuxMixin):
-      # TODO(pclay): Remove when Windows refactor below is complete.
-      if vm.ssh_external_time:
-        samples.append(
-            sample.Sample('Time to SSH - External',
-                          vm.ssh_external_time - min_create_start_time,
-                          'seconds', metadata))
-      if vm.ssh_internal_time:
-        samples.append(
-            sample.Sample('Time to SSH - Internal',
-                          vm.ssh_internal_time - min_create_start_time,
-                          'seconds', metadata))
-
-    # TIME TO PORT LISTENING
-    max_boot_time_sec = max(max_boot_time_sec, boot_time_sec)
-    samples.append(
-        sample.Sample('Boot Time', boot_time_sec, 'seconds', metadata))
-    if FLAGS.cluster_boot_test_port_listening:
-      assert vm.port_listening_time
-      assert vm.port_listening_time >= vm.create_start_time
-      port_listening_time_sec = vm.port_listening_time - min_create_start_time
-      max_port_listening_time_sec = max(max_port_listening_time_sec,
-                                        port_listening_time_sec)
-      samples.append(
-          sample.Sample('Port Listening Time', port_listening_time_sec,
-                        'seconds', metadata))
-
-    # TIME TO RDP LISTENING
-    # TODO(pclay): refactor so Windows specifics aren't in linux_benchmarks
-    if FLAGS.cluster_boot_test_rdp_port_listening:
-      assert vm.rdp_port_listening_time
-      assert vm.rdp_port_listening_time >= vm.create_start_time
-      rdp_port_listening_time_sec = (
-          vm.rdp_port_listening_time - min_create_start_time)
-      max_rdp_port_listening_time_sec = max(max_rdp_port_listening_time_sec,
-                                            rdp_port_listening_time_sec)
-      samples.append(
-          sample.Sample('RDP Port Listening Time', rdp_port_listening_time_sec,
-                        'seconds', metadata))
+  # TIME TO CREATE ASYNC RETURN
+  samples += [
+      sample.Sample('Time to Create Async Return',
+                    create_return_time - min_create_start_time, 'seconds',
+                    metadata)
+      for create_return_time, metadata in zip(create_return_times, metadatas)
+      if create_return_time
+  ]
+
+  # TIME TO RUNNING
+  samples += [
+      sample.Sample('Time to Running', is_running_time - create_start_time,
+                    'seconds', metadata)
+      for is_running_time, create_start_time, metadata in zip(
+          is_running_times, create_start_times, metadatas)
+      if is_running_time
+  ]
+
+  # TIME TO SSH
+  # TODO(pclay): Remove when Windows refactor below is complete.
+  # Only Linux VMs record SSH times.
+  linux_vm_metadatas = [
+      (vm, metadata) for vm, metadata in zip(vms, metadatas)
+      if isinstance(vm, linux_virtual_machine.BaseLinuxMixin)
+  ]
+  samples += [
+      sample.Sample('Time to SSH - External',
+                    vm.ssh_external_time - min_create_start_time, 'seconds',
+                    metadata)
+      for vm, metadata in linux_vm_metadatas
+      if vm.ssh_external_time
+  ]
+  samples += [
+      sample.Sample('Time to SSH - Internal',
+                    vm.ssh_internal_time - min_create_start_time, 'seconds',
+                    metadata)
+      for vm, metadata in linux_vm_metadatas
+      if vm.ssh_internal_time
+  ]
+
+  # BOOT TIME
+  boot_times_sec = [
+      bootable_time - min_create_start_time for bootable_time in bootable_times
+  ]
+  max_boot_time_sec = max(boot_times_sec)
+  samples += [
+      sample.Sample('Boot Time', boot_time_sec, 'seconds', metadata)
+      for boot_time_sec, metadata in zip(boot_times_sec, metadatas)
+  ]
+
+  # TIME TO PORT LISTENING
+  if FLAGS.cluster_boot_test_port_listening:
+    port_listening_times = [vm.port_listening_time for vm in vms]
+    for port_listening_time, create_start_time in zip(port_listening_times,
+                                                      create_start_times):
+      assert port_listening_time
+      assert port_listening_time >= create_start_time
+    port_listening_times_sec = [
+        port_listening_time - min_create_start_time
+        for port_listening_time in port_listening_times
+    ]
+    max_port_listening_time_sec = max(port_listening_times_sec)
+    samples += [
+        sample.Sample('Port Listening Time', port_listening_time_sec,
+                      'seconds', metadata)
+        for port_listening_time_sec, metadata in zip(port_listening_times_sec,
+                                                     metadatas)
+    ]
+
+  # TIME TO RDP LISTENING
+  # TODO(pclay): refactor so Windows specifics aren't in linux_benchmarks
+  if FLAGS.cluster_boot_test_rdp_port_listening:
+    rdp_port_listening_times = [vm.rdp_port_listening_time for vm in vms]
+    for rdp_port_listening_time, create_start_time in zip(
+        rdp_port_listening_times, create_start_times):
+      assert rdp_port_listening_time
+      assert rdp_port_listening_time >= create_start_time
+    rdp_port_listening_times_sec = [
+        rdp_port_listening_time - min_create_start_time
+        for rdp_port_listening_time in rdp_port_listening_times
+    ]
+    max_rdp_port_listening_time_sec = max(rdp_port_listening_times_sec)
+    samples += [
+        sample.Sample('RDP Port Listening Time', rdp_port_listening_time_sec,
+                      'seconds', metadata)
+        for rdp_port_listening_time_sec, metadata in zip(
+            rdp_port_listening_times_sec, metadatas)
+    ]
 
   # Add a total cluster boot sample as the maximum boot time.
   metadata = {
-      'num_vms': len(vms),
-      'os_type': ','.join(sorted(os_types)),
-      'max_create_delay_sec': '%0.1f' % max_create_delay_sec
+      'num_vms': num_vms,
+      'os_type': ','.join(sorted(set(os_types))),
+      'max_create_delay_sec': f'{max_create_delay_sec:.1f}'
   }
   samples.append(
       sample.Sample('Cluster Boot Time', max_boot_time_sec, 'seconds',
@@ -285,8 +335,12 @@ def MeasureDelete(
   """
   before_delete_timestamp = time.time()
   background_tasks.RunThreaded(lambda vm: vm.Delete(), vms)
-  delete_times = [vm.delete_end_time - vm.delete_start_time for vm in vms]
-  max_delete_end_time = max([vm.delete_end_time for vm in vms])
+  delete_end_times = [vm.delete_end_time for vm in vms]
+  delete_times = [
+      delete_end_time - vm.delete_start_time
+      for delete_end_time, vm in zip(delete_end_times, vms)
+  ]
+  max_delete_end_time = max(delete_end_times)
   cluster_delete_time = max_delete_end_time - before_delete_timestamp
   return _GetVmOperationDataSamples(delete_times, cluster_delete_time, 'Delete',
                                     vms)
@@ -306,20 +360,18 @@ def _GetVmOperationDataSamples(
   Returns:
     List of samples constructed from data.
   """
+  num_vms = len(vms)
   samples = []
-  metadata_list = []
-  for i, vm in enumerate(vms):
+  for i, (operation_time, vm) in enumerate(zip(operation_times, vms)):
     metadata = {
         'machine_instance': i,
-        'num_vms': len(vms),
+        'num_vms': num_vms,
         'os_type': vm.OS_TYPE
     }
-    metadata_list.append(metadata)
-  for operation_time, metadata in zip(operation_times, metadata_list):
     samples.append(
         sample.Sample(f'{operation} Time', operation_time, 'seconds', metadata))
   os_types = set([vm.OS_TYPE for vm in vms])
-  metadata = {'num_vms': len(vms), 'os_type': ','.join(sorted(os_types))}
+  metadata = {'num_vms': num_vms, 'os_type': ','.join(sorted(os_types))}
   samples.append(
       sample.Sample(f'Cluster {operation} Time', cluster_time, 'seconds',
                     metadata))
@@ -909,9 +909,19 @@ class BaseLinuxMixin(virtual_machine.BaseOsMixin):
     self._WaitForSSH(self.internal_ip)
     self.ssh_internal_time = time.time()
 
-  @vm_util.Retry(log_errors=False, poll_interval=1)
   def _WaitForSSH(self, ip_address: Union[str, None] = None):
     """Waits until the VM is ready."""
+    # Poll quickly at first and back off, so that the time to SSH metrics are
+    # not bounded by the poll interval when the VM is reachable right away.
+    retry = vm_util.Retry(
+        log_errors=False,
+        poll_interval=FLAGS.cluster_boot_ssh_poll_initial_ms / 1000,
+        backoff=2,
+        max_poll_interval=FLAGS.cluster_boot_ssh_poll_max_ms / 1000)
+    retry(self._TestSSH)(ip_address)
+
+  def _TestSSH(self, ip_address: Union[str, None] = None):
+    """Runs a command on the VM to check that it is ready."""
     # Always wait for remote host command to succeed, because it is necessary to
     # run benchmarks
     resp, _ = self.RemoteHostCommand('hostname', retries=1,
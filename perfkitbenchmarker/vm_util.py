@@ -228,12 +228,13 @@ def GetSshOptions(ssh_key_filename, connect_timeout=None):
 
 def Retry(poll_interval=POLL_INTERVAL, max_retries=MAX_RETRIES,
           timeout=None, fuzz=FUZZ, log_errors=True,
-          retryable_exceptions=None):
+          retryable_exceptions=None, backoff=1, max_poll_interval=None):
   """A function decorator that will retry when exceptions are thrown.
 
   Args:
     poll_interval: The time between tries in seconds. This is the maximum poll
-        interval when fuzz is specified.
+        interval when fuzz is specified. When backoff is specified, this is
+        the interval before the first retry.
     max_retries: The maximum number of retries before giving up. If -1, this
         means continue until the timeout is reached. The function will stop
         retrying when either max_retries is met or timeout is reached.
@@ -248,6 +249,10 @@ def Retry(poll_interval=POLL_INTERVAL, max_retries=MAX_RETRIES,
     retryable_exceptions: A tuple of exceptions that should be retried. By
         default, this is None, which indicates that all exceptions should
         be retried.
+    backoff: The factor the poll interval is multiplied by after each try. At
+        1, every try uses poll_interval.
+    max_poll_interval: The upper bound on the poll interval in seconds,
+        including the first one. If None, the poll interval is unbounded.
 
   Returns:
     A function that wraps functions in retry logic. It can be
@@ -269,13 +274,17 @@ def Retry(poll_interval=POLL_INTERVAL, max_retries=MAX_RETRIES,
         deadline = float('inf')
 
       tries = 0
+      current_poll_interval = poll_interval
       while True:
         try:
           tries += 1
           return f(*args, **kwargs)
         except retryable_exceptions as e:
           fuzz_multiplier = 1 - fuzz + random.random() * fuzz
-          sleep_time = poll_interval * fuzz_multiplier
+          if max_poll_interval is not None:
+            current_poll_interval = min(current_poll_interval,
+                                        max_poll_interval)
+          sleep_time = current_poll_interval * fuzz_multiplier
           if ((time.time() + sleep_time) >= deadline or
               (max_retries >= 0 and tries > max_retries)):
             raise
@@ -283,6 +292,7 @@ def Retry(poll_interval=POLL_INTERVAL, max_retries=MAX_RETRIES,
             if log_errors:
               logging.info('Retrying exception running %s: %s', f.__name__, e)
             time.sleep(sleep_time)
+            current_poll_interval *= backoff
     return WrappedFunction
   return Wrap
 
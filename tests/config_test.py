@@ -80,6 +80,12 @@ class ConfigsTestCase(unittest.TestCase):
     self.assertIsInstance(
         configs.LoadMinimalConfig(VALID_CONFIG, CONFIG_NAME), dict)
 
+  def testLoadMinimalConfigReturnsCopies(self):
+    config = configs.LoadMinimalConfig(VALID_CONFIG, CONFIG_NAME)
+    config['vm_groups']['default']['vm_spec'] = {}
+    config = configs.LoadMinimalConfig(VALID_CONFIG, CONFIG_NAME)
+    self.assertIsNone(config['vm_groups']['default']['vm_spec'])
+
   def testWrongName(self):
     with self.assertRaises(KeyError):
       configs.LoadMinimalConfig(VALID_CONFIG, INVALID_NAME)
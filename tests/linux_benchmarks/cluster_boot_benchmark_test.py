@@ -3,8 +3,11 @@
 import datetime
 import unittest
 
+from absl import flags
+from absl.testing import flagsaver
 import freezegun
 import mock
+from perfkitbenchmarker import background_tasks
 from perfkitbenchmarker import context
 from perfkitbenchmarker import sample
 from perfkitbenchmarker import test_util
@@ -12,6 +15,18 @@ from perfkitbenchmarker.linux_benchmarks import cluster_boot_benchmark
 from perfkitbenchmarker.providers.gcp import gce_virtual_machine
 from tests import pkb_common_test_case
 
+FLAGS = flags.FLAGS
+
+
+def _SampleMetadata(index: int, os_type: str) -> dict[str, object]:
+  """Returns the per-VM boot sample metadata for the mixed cluster below."""
+  return {
+      'machine_instance': index,
+      'num_vms': 3,
+      'os_type': os_type,
+      'create_delay_sec': f'{index}.0',
+  }
+
 
 def vm_mock(index: int, timestamp: float) -> mock.Mock:
   """Creates a mock vm and Adds the needed vm attributes to the mock vm.
@@ -73,6 +88,20 @@ class ClusterBootBenchmarkTest(pkb_common_test_case.PkbCommonTestCase,
     # assert actual and expected samples are equal
     self.assertSampleListsEqualUpToTimestamp(actual_samples, expected_samples)
 
+  def testMeasureDeleteRespectsMaxConcurrentThreads(self):
+    FLAGS.max_concurrent_threads = 2
+    vms_to_test = [vm_mock(i, 1625863325.003580) for i in range(3)]
+    self.enter_context(
+        mock.patch.object(
+            background_tasks,
+            'RunParallelThreads',
+            wraps=background_tasks.RunParallelThreads))
+
+    cluster_boot_benchmark.MeasureDelete(vms_to_test)
+
+    background_tasks.RunParallelThreads.assert_called_once_with(
+        mock.ANY, max_concurrency=2, post_task_delay=0)
+
   @freezegun.freeze_time('2023-03-07')
   def testGetTimeToBoot(self):
     context.SetThreadBenchmarkSpec(
@@ -130,5 +159,85 @@ class ClusterBootBenchmarkTest(pkb_common_test_case.PkbCommonTestCase,
     self.assertCountEqual(actuals, expecteds)
 
 
+  def _CreateMixedCluster(self):
+    """Creates two Linux VMs and one non-Linux VM that start 1s apart."""
+    context.SetThreadBenchmarkSpec(
+        pkb_common_test_case.CreateBenchmarkSpecFromYaml()
+    )
+    vm_spec = gce_virtual_machine.GceVmSpec('cluster_boot_benchmark_test')
+    vms = [
+        gce_virtual_machine.Ubuntu2204BasedGceVirtualMachine(vm_spec),
+        gce_virtual_machine.Ubuntu2204BasedGceVirtualMachine(vm_spec),
+        # Not a BaseLinuxMixin, so its SSH times must not be reported.
+        mock.Mock(OS_TYPE='windows2022_core'),
+    ]
+    for i, vm in enumerate(vms):
+      vm.create_start_time = 1 + i
+      vm.create_return_time = 2 + i
+      vm.is_running_time = 3 + 2 * i
+      vm.ssh_internal_time = 4 + 2 * i
+      vm.ssh_external_time = 5 + 2 * i
+      vm.port_listening_time = 6 + 2 * i
+      vm.bootable_time = 7 + 2 * i
+    return vms
+
+  @freezegun.freeze_time('2023-03-07')
+  def testGetTimeToBootMultipleVms(self):
+    vms = self._CreateMixedCluster()
+
+    actuals = cluster_boot_benchmark.GetTimeToBoot(vms)
+
+    os_types = ['ubuntu2204', 'ubuntu2204', 'windows2022_core']
+    metric_values = {
+        'Time to Create Async Return': [1.0, 2.0, 3.0],
+        'Time to Running': [2.0, 3.0, 4.0],
+        'Time to SSH - External': [4.0, 6.0],
+        'Time to SSH - Internal': [3.0, 5.0],
+        'Boot Time': [6.0, 8.0, 10.0],
+    }
+    expecteds = []
+    for metric, values in metric_values.items():
+      for i, value in enumerate(values):
+        expecteds.append(
+            sample.Sample(metric, value, 'seconds',
+                          _SampleMetadata(i, os_types[i]),
+                          timestamp=1678147200.0))
+    expecteds.append(
+        sample.Sample(
+            'Cluster Boot Time',
+            10.0,
+            'seconds', {
+                'num_vms': 3,
+                'os_type': 'ubuntu2204,windows2022_core',
+                'max_create_delay_sec': '2.0',
+            },
+            timestamp=1678147200.0))
+    self.assertCountEqual(actuals, expecteds)
+    self.assertFalse([
+        s for s in actuals if s.metric.startswith('Time to SSH') and
+        s.metadata['machine_instance'] == 2
+    ])
+
+  @flagsaver.flagsaver(cluster_boot_test_port_listening=True)
+  @freezegun.freeze_time('2023-03-07')
+  def testGetTimeToBootPortListening(self):
+    vms = self._CreateMixedCluster()
+
+    actuals = cluster_boot_benchmark.GetTimeToBoot(vms)
+
+    port_listening_samples = [
+        s for s in actuals if s.metric == 'Port Listening Time'
+    ]
+    self.assertEqual([5.0, 7.0, 9.0],
+                     [s.value for s in port_listening_samples])
+    self.assertEqual([0, 1, 2], [
+        s.metadata['machine_instance'] for s in port_listening_samples
+    ])
+    cluster_samples = [
+        s for s in actuals if s.metric == 'Cluster Port Listening Time'
+    ]
+    self.assertEqual([9.0], [s.value for s in cluster_samples])
+
+
 if __name__ == '__main__':
   unittest.main()
@@ -29,6 +29,8 @@ from perfkitbenchmarker import os_types
 from perfkitbenchmarker import sample
 from perfkitbenchmarker import test_util
 from perfkitbenchmarker import vm_util
+# Defines the --cluster_boot_ssh_poll_* flags used by _WaitForSSH.
+from perfkitbenchmarker.linux_benchmarks import cluster_boot_benchmark  # pylint: disable=unused-import
 from tests import matchers
 from tests import pkb_common_test_case
 
@@ -430,6 +432,32 @@ class TestRemoteCommand(pkb_common_test_case.PkbCommonTestCase):
       self.vm.RemoteCommand('foo', retries=2)
 
 
+class TestWaitForSSH(pkb_common_test_case.PkbCommonTestCase):
+
+  @flagsaver.flagsaver(
+      cluster_boot_ssh_poll_initial_ms=200, cluster_boot_ssh_poll_max_ms=300)
+  def testPollsWithBackoff(self):
+    vm = CreateTestLinuxVm()
+    vm.RemoteHostCommand = mock.Mock(  # pylint: disable=invalid-name
+        side_effect=[
+            errors.VirtualMachine.RemoteCommandError('not ready'),
+            errors.VirtualMachine.RemoteCommandError('not ready'),
+            ('test-hostname\n', ''),
+        ])
+    mock_sleep = self.enter_context(mock.patch('time.sleep'))
+    # Remove the fuzz from the poll interval.
+    self.enter_context(mock.patch('random.random', return_value=1.0))
+
+    # TestLinuxVirtualMachine stubs out _WaitForSSH, so call the real one.
+    linux_virtual_machine.BaseLinuxMixin._WaitForSSH(vm, '10.0.0.1')
+
+    self.assertEqual([mock.call(0.2), mock.call(0.3)],
+                     mock_sleep.call_args_list)
+    vm.RemoteHostCommand.assert_called_with(
+        'hostname', retries=1, ip_address='10.0.0.1')
+    self.assertEqual('test-hostname', vm.hostname)
+
+
 class TestPartitionTable(unittest.TestCase):
 
   def CreateVm(self, remote_command_text):
@@ -223,6 +223,29 @@ class IssueCommandTestCase(pkb_common_test_case.PkbCommonTestCase):
                   str(cm.exception))
 
 
+class RetryTestCase(pkb_common_test_case.PkbCommonTestCase):
+
+  @mock.patch('time.sleep')
+  def testBackoff(self, mock_sleep):
+    func = mock.Mock(side_effect=[ValueError, ValueError, ValueError, 'done'])
+    retry = vm_util.Retry(
+        poll_interval=0.1, fuzz=0, log_errors=False, backoff=2,
+        max_poll_interval=0.3)
+    self.assertEqual('done', retry(func)())
+    self.assertEqual([mock.call(0.1), mock.call(0.2), mock.call(0.3)],
+                     mock_sleep.call_args_list)
+
+  @mock.patch('time.sleep')
+  def testMaxPollIntervalBoundsFirstRetry(self, mock_sleep):
+    func = mock.Mock(side_effect=[ValueError, ValueError, 'done'])
+    retry = vm_util.Retry(
+        poll_interval=2.0, fuzz=0, log_errors=False, backoff=2,
+        max_poll_interval=1.0)
+    self.assertEqual('done', retry(func)())
+    self.assertEqual([mock.call(1.0), mock.call(1.0)],
+                     mock_sleep.call_args_list)
+
+
 class VmUtilTest(pkb_common_test_case.PkbCommonTestCase):
 
   def setUp(self):